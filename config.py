@@ -1,9 +1,19 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+@lru_cache(maxsize=None)
+def ensure_parent_dir(path: str):
+    """Create the directory containing path, at most once per process"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
 class Config:
     """Configuration class for the Polymarket Price Agent"""
     
@@ -19,6 +29,13 @@ class Config:
     POLYMARKET_MARKET_SLUG = os.getenv('POLYMARKET_MARKET_SLUG')
     POLYMARKET_GAMMA_API_BASE = 'https://gamma-api.polymarket.com'
     POLYMARKET_CLOB_API_BASE = 'https://clob.polymarket.com'
+    API_CACHE_DIR = os.getenv('API_CACHE_DIR', './.cache')
+    
+    # Google Sheets Configuration (only used by GoogleSheetsClient)
+    GOOGLE_SHEET_ID = os.getenv('GOOGLE_SHEET_ID')
+    GOOGLE_SHEET_NAME = os.getenv('GOOGLE_SHEET_NAME', 'Polymarket Prices')
+    GOOGLE_CREDENTIALS_FILE = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
+    GOOGLE_SHEETS_API_BASE = 'https://sheets.googleapis.com/v4/spreadsheets'
     
     # Agent Configuration
     UPDATE_INTERVAL_MINUTES = int(os.getenv('UPDATE_INTERVAL_MINUTES', 10))
@@ -27,21 +44,40 @@ class Config:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'polymarket_agent.log')
     
+    # Declarative rules checked by validate_config: expected type, whether
+    # the setting must be present and, for numbers, the smallest valid value
+    SCHEMA = {
+        'POLYMARKET_URL': {'type': str, 'required': True},
+        'MARKDOWN_FILE_PATH': {'type': str, 'required': True},
+        'MAX_MARKDOWN_ENTRIES': {'type': int, 'minimum': 0},
+        'UPDATE_INTERVAL_MINUTES': {'type': int, 'minimum': 1},
+        'LOG_LEVEL': {'type': str},
+        'LOG_FILE': {'type': str},
+    }
+    
     @classmethod
     def validate_config(cls):
-        """Validate that all required configuration is present"""
-        missing_configs = []
+        """Validate that all required configuration is present and well-formed"""
+        invalid_configs = []
         
-        if not cls.POLYMARKET_URL:
-            missing_configs.append('POLYMARKET_URL')
+        for key, rules in cls.SCHEMA.items():
+            value = getattr(cls, key)
+            
+            if value is None or value == '':
+                if rules.get('required'):
+                    invalid_configs.append(key)
+            elif not isinstance(value, rules['type']):
+                invalid_configs.append(f"{key} must be a {rules['type'].__name__}")
+            elif 'minimum' in rules and value < rules['minimum']:
+                invalid_configs.append(f"{key} must be at least {rules['minimum']}")
         
         # Validate that the markdown file path directory can be created
         try:
-            os.makedirs(os.path.dirname(cls.MARKDOWN_FILE_PATH), exist_ok=True)
+            ensure_parent_dir(cls.MARKDOWN_FILE_PATH)
         except Exception as e:
-            missing_configs.append(f'Cannot create markdown file directory: {e}')
+            invalid_configs.append(f'Cannot create markdown file directory: {e}')
         
-        if missing_configs:
-            raise ValueError(f"Missing required configuration: {', '.join(missing_configs)}")
+        if invalid_configs:
+            raise ValueError(f"Missing or invalid configuration: {', '.join(invalid_configs)}")
         
         return True
\ No newline at end of file
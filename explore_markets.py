@@ -3,28 +3,25 @@
 Quick script to explore available Polymarket markets
 """
 
-import requests
-import json
+from polymarket_client import PolymarketClient
 
 def explore_markets():
     """Explore what markets are available"""
     print("🔍 Exploring Polymarket Markets")
     print("=" * 40)
     
+    client = None
     try:
-        # Get recent markets
-        url = "https://gamma-api.polymarket.com/markets"
-        params = {
-            "limit": 10,
-            "active": True,
-            "closed": False
-        }
+        # Share one client (and its keep-alive session) for every request
+        client = PolymarketClient()
         
-        print(f"🌐 Fetching from: {url}")
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+        # Get the busiest open markets
+        print(f"🌐 Fetching from: {client.gamma_base_url}/markets")
+        markets = client.list_active_markets(limit=10)
+        if markets is None:
+            print("❌ Failed to fetch active markets")
+            return
         
-        markets = response.json()
         print(f"✅ Found {len(markets)} markets")
         
         print("\n📊 Available Active Markets:")
@@ -62,9 +59,6 @@ def explore_markets():
                 print(f"🧪 Testing our agent with market: {test_slug}")
                 
                 # Now test with our client
-                from polymarket_client import PolymarketClient
-                client = PolymarketClient()
-                
                 price_data = client.get_simplified_price_data(test_slug)
                 if price_data:
                     print("✅ Agent successfully fetched data!")
@@ -76,6 +70,9 @@ def explore_markets():
         
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        if client:
+            client.close()
 
 if __name__ == "__main__":
     explore_markets()
\ No newline at end of file
@@ -1,41 +1,134 @@
 import logging
+import random
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from typing import TYPE_CHECKING, Dict, List, Optional
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 
+# The google-auth imports are deferred to first use so that importing this
+# module stays cheap for runs that never touch Google Sheets
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+# Define the scope for Google Sheets API
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+# Upper bound, in seconds, of the random delay added to each retry backoff
+RETRY_BACKOFF_JITTER = 0.5
+
+_credentials = None
+_credentials_lock = threading.Lock()
+
+
+class SheetsRetry(Retry):
+    """
+    Retry policy for the Sheets API
+    
+    Idempotent requests are retried on 429 and 5xx responses and on read
+    errors. POST requests (append, batchUpdate) are only retried on a 429
+    response, which the API returns before applying the write, or when the
+    connection could not be opened at all; a read error after the request
+    was sent is raised, since the write may already have been applied.
+    Every backoff gets random jitter so several agents hitting the quota
+    at once do not retry in lockstep.
+    """
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == 'POST' and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        if method == 'POST' and error is not None and not self._is_connection_error(error):
+            raise error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+    
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, RETRY_BACKOFF_JITTER)
+
+
+def get_credentials() -> 'Credentials':
+    """
+    Load the service account credentials once per process
+    
+    Returns:
+        The shared Credentials object used by every GoogleSheetsClient
+    """
+    global _credentials
+    with _credentials_lock:
+        if _credentials is None:
+            from google.oauth2.service_account import Credentials
+            
+            _credentials = Credentials.from_service_account_file(
+                Config.GOOGLE_CREDENTIALS_FILE,
+                scopes=SCOPES
+            )
+        return _credentials
+
+
 class GoogleSheetsClient:
     """Client for interacting with Google Sheets API"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.service = None
+        self.session = None
         self.sheet_id = Config.GOOGLE_SHEET_ID
         self.sheet_name = Config.GOOGLE_SHEET_NAME
+        self._frozen_headers = None
+        
+        # Resolve the endpoints once instead of formatting them on every call
+        self._values_base_url = f"{Config.GOOGLE_SHEETS_API_BASE}/{self.sheet_id}/values"
+        self._append_url = self._range_url(f"{self.sheet_name}!A:Z", ':append')
+        self._batch_get_url = self._values_url(':batchGet')
+        self._batch_update_url = self._values_url(':batchUpdate')
+        
         self._authenticate()
     
     def _authenticate(self):
         """Authenticate with Google Sheets API using service account credentials"""
         try:
-            # Define the scope for Google Sheets API
-            scopes = ['https://www.googleapis.com/auth/spreadsheets']
+            from google.auth.transport.requests import AuthorizedSession
             
-            # Load service account credentials
-            credentials = Credentials.from_service_account_file(
-                Config.GOOGLE_CREDENTIALS_FILE, 
-                scopes=scopes
-            )
+            # Load (or reuse) the shared service account credentials
+            credentials = get_credentials()
             
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=credentials)
+            # Reuse one pooled, keep-alive session for every API call; it
+            # refreshes the access token itself shortly before it expires
+            self.session = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=10,
+                max_retries=SheetsRetry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                    respect_retry_after_header=True
+                )
+            )
+            self.session.mount('https://', adapter)
             self.logger.info("Successfully authenticated with Google Sheets API")
             
         except Exception as e:
             self.logger.error(f"Failed to authenticate with Google Sheets API: {e}")
             raise
     
+    def _values_url(self, suffix: str) -> str:
+        """Build the REST URL for a spreadsheets.values endpoint"""
+        return f"{self._values_base_url}{suffix}"
+    
+    def _range_url(self, range_name: str, method: str = '') -> str:
+        """Build the REST URL for a range, e.g. values/Sheet1!A:Z:append"""
+        return self._values_url(f"/{quote(range_name, safe='')}{method}")
+    
     def create_headers_if_needed(self, headers: List[str]) -> bool:
         """
         Create headers in the sheet if they don't exist
@@ -78,17 +171,40 @@ class GoogleSheetsClient:
             List of lists containing the data, or None if failed
         """
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.sheet_id,
-                range=range_name
-            ).execute()
+            response = self.session.get(self._range_url(range_name))
+            response.raise_for_status()
             
-            return result.get('values', [])
+            return response.json().get('values', [])
             
-        except HttpError as e:
+        except requests.exceptions.RequestException as e:
             self.logger.error(f"Error reading sheet data: {e}")
             return None
     
+    def batch_get(self, ranges: List[str]) -> Optional[Dict[str, List[List]]]:
+        """
+        Get data from several ranges in a single request
+        
+        Args:
+            ranges: The ranges to read (e.g., ["Sheet1!1:1", "Sheet1!A:A"])
+            
+        Returns:
+            Dictionary mapping each requested range to its data, or None if failed
+        """
+        try:
+            response = self.session.get(self._batch_get_url, params={'ranges': ranges})
+            response.raise_for_status()
+            
+            # valueRanges come back in request order, with normalized names
+            value_ranges = response.json().get('valueRanges', [])
+            return {
+                range_name: value_range.get('values', [])
+                for range_name, value_range in zip(ranges, value_ranges)
+            }
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error reading sheet ranges: {e}")
+            return None
+    
     def write_row_data(self, data: List[List], range_name: str = None) -> bool:
         """
         Write row data to the sheet
@@ -108,17 +224,17 @@ class GoogleSheetsClient:
                 'values': data
             }
             
-            result = self.service.spreadsheets().values().update(
-                spreadsheetId=self.sheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
-            ).execute()
+            response = self.session.put(
+                self._range_url(range_name),
+                params={'valueInputOption': 'RAW'},
+                json=body
+            )
+            response.raise_for_status()
             
             self.logger.info(f"Successfully wrote {len(data)} rows to sheet")
             return True
             
-        except HttpError as e:
+        except requests.exceptions.RequestException as e:
             self.logger.error(f"Error writing to sheet: {e}")
             return False
     
@@ -137,18 +253,20 @@ class GoogleSheetsClient:
                 'values': data
             }
             
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.sheet_id,
-                range=f"{self.sheet_name}!A:Z",
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
+            response = self.session.post(
+                self._append_url,
+                params={
+                    'valueInputOption': 'RAW',
+                    'insertDataOption': 'INSERT_ROWS'
+                },
+                json=body
+            )
+            response.raise_for_status()
             
             self.logger.info(f"Successfully appended {len(data)} rows to sheet")
             return True
             
-        except HttpError as e:
+        except requests.exceptions.RequestException as e:
             self.logger.error(f"Error appending to sheet: {e}")
             return False
     
@@ -156,6 +274,16 @@ class GoogleSheetsClient:
         """
         Write price data to the Google Sheet
         
+        The header row is only checked on the first write of the process.
+        That first write reads the header row and column A in one batchGet
+        and then writes the headers (if missing) and the new row in one
+        batchUpdate; every later write is a single append.
+        
+        The column order is frozen on the first write, and later rows are
+        laid out in that order. If the sheet already has the same headers in
+        a different order, their order is used; headers with different names
+        are left alone and only logged.
+        
         Args:
             price_data: Dictionary containing price data
             
@@ -163,23 +291,85 @@ class GoogleSheetsClient:
             True if successful, False otherwise
         """
         try:
-            # Prepare headers based on the price data keys
-            headers = list(price_data.keys())
+            if self._frozen_headers is not None:
+                if price_data.keys() != set(self._frozen_headers):
+                    self.logger.warning("Price data fields differ from the sheet headers")
+                
+                row_data = [[price_data.get(key, '') for key in self._frozen_headers]]
+                return self.append_row_data(row_data)
             
-            # Create headers if needed
-            if not self.create_headers_if_needed(headers):
+            headers = self._write_first_row(price_data)
+            if not headers:
                 return False
             
-            # Prepare the row data
-            row_data = [list(price_data.values())]
-            
-            # Append the data
-            return self.append_row_data(row_data)
+            self._frozen_headers = headers
+            return True
             
         except Exception as e:
             self.logger.error(f"Error writing price data: {e}")
             return False
     
+    def _write_first_row(self, price_data: Dict) -> Optional[tuple]:
+        """
+        Check headers and write the first row in two round-trips
+        
+        Args:
+            price_data: Dictionary containing price data
+            
+        Returns:
+            The column order the row was written in, or None if failed
+        """
+        try:
+            header_range = f"{self.sheet_name}!1:1"
+            column_range = f"{self.sheet_name}!A:A"
+            result = self.batch_get([header_range, column_range])
+            if result is None:
+                return None
+            
+            existing_headers = (result.get(header_range) or [[]])[0]
+            existing_rows = len(result.get(column_range, []))
+            
+            # Lay the row out in the sheet's column order when the sheet
+            # already has the same headers
+            headers = list(price_data)
+            if existing_headers and existing_headers != headers and set(existing_headers) == set(headers):
+                self.logger.info("Using the column order of the existing headers")
+                headers = existing_headers
+            row_data = [[price_data.get(key, '') for key in headers]]
+            
+            data = []
+            if not existing_headers:
+                # No headers exist, write them along with the row
+                self.logger.info("Creating headers in the sheet")
+                data.append({
+                    'range': f"{self.sheet_name}!A1",
+                    'values': [headers]
+                })
+                existing_rows = max(existing_rows, 1)
+            elif existing_headers != headers:
+                self.logger.warning("Existing headers don't match expected headers")
+            
+            data.append({
+                'range': f"{self.sheet_name}!A{existing_rows + 1}",
+                'values': row_data
+            })
+            
+            response = self.session.post(
+                self._batch_update_url,
+                json={
+                    'valueInputOption': 'RAW',
+                    'data': data
+                }
+            )
+            response.raise_for_status()
+            
+            self.logger.info(f"Successfully wrote {len(row_data)} rows to sheet")
+            return tuple(headers)
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error writing first row to sheet: {e}")
+            return None
+    
     def get_last_update_time(self) -> Optional[datetime]:
         """
         Get the timestamp of the last update from the sheet
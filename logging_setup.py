@@ -0,0 +1,19 @@
+"""
+Shared logging configuration for the test scripts
+"""
+
+import logging
+
+LOG_FORMAT = '%(levelname)s: %(message)s'
+
+
+def setup_once():
+    """Configure console logging unless the root logger already has handlers"""
+    if logging.getLogger().handlers:
+        return
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[logging.StreamHandler()]
+    )
@@ -1,16 +1,106 @@
+import json
 import logging
+import mmap
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
-from config import Config
+from config import Config, ensure_parent_dir
+
+# Heading that starts every market update entry
+ENTRY_MARKER = '## 📊 Market Update'
+
+# Byte form of the entry marker, used when working on the raw file contents
+_ENTRY_MARKER_BYTES = ENTRY_MARKER.encode('utf-8')
+
+# Precompiled patterns for locating entries and their timestamps
+_ENTRY_START_RE = re.compile(re.escape(b'\n' + _ENTRY_MARKER_BYTES))
+_TS_RE = re.compile(re.escape(ENTRY_MARKER) + r' - (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC)')
+
+# Prefix of the note left in the header once old entries have been dropped
+TRUNCATION_NOTE_PREFIX = '*Older entries truncated'
+_TRUNCATION_NOTE_PREFIX_BYTES = TRUNCATION_NOTE_PREFIX.encode('utf-8')
+
+# Entries allowed past max_entries before the file is compacted, so the full
+# rewrite only happens every few updates. The surplus is a fifth of
+# max_entries, between 1 and COMPACT_EVERY, which makes max_entries a soft
+# limit: the file holds up to max_entries plus that surplus
+COMPACT_EVERY = 10
+
+# Header line marking a file whose entries are in oldest-first order; files
+# written before entries were appended are newest first and lack it
+ORDER_NOTE = '*Entries are listed oldest first; the latest update is at the bottom*'
+_ORDER_NOTE_BYTES = ORDER_NOTE.encode('utf-8')
+
+# Table header and separator written above every outcome table
+PRICE_TABLE_HEADER = "| Outcome | Price | Probability |\n|---------|-------|-------------|\n"
+
+# Bytes read from the start of the newest entry to find its timestamp
+LAST_ENTRY_READ_BYTES = 4096
+
+
+@lru_cache(maxsize=256)
+def _fmt_iso_to_utc(timestamp: str) -> str:
+    """Format an ISO timestamp for display, returning it unchanged if invalid"""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
+    except (AttributeError, TypeError, ValueError):
+        return timestamp
+
+
+@lru_cache(maxsize=256)
+def _parse_utc(time_str: str) -> datetime:
+    """Parse a timestamp as written in an entry heading"""
+    return datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S UTC')
+
+
+def _format_outcome_row(name: str, price) -> str:
+    """Format one outcome as a markdown table row"""
+    if price is None:
+        return f"| {name} | N/A | N/A |\n"
+    
+    try:
+        price_val = float(price)
+    except (TypeError, ValueError):
+        return f"| {name} | {price} | N/A |\n"
+    
+    if price_val <= 1:  # Assume it's already a probability
+        return f"| {name} | ${price_val:.2f} | {price_val:.1%} |\n"
+    
+    # Assume it's in cents
+    return f"| {name} | {price_val}¢ | {price_val:.1f}% |\n"
+
 
 class MarkdownWriter:
     """Client for writing market data to markdown files"""
     
+    __slots__ = (
+        'logger', 'file_path', 'max_entries', 'index_path', '_offsets', '_header',
+        '_compact_slack'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.file_path = Config.MARKDOWN_FILE_PATH
         self.max_entries = Config.MAX_MARKDOWN_ENTRIES
+        self.index_path = f"{self.file_path}.idx"
+        self._compact_slack = min(COMPACT_EVERY, max(1, self.max_entries // 5))
+        
+        # The header only depends on values known now, so build it once
+        self._header = f"""# 🔥 Polymarket Price Monitor
+
+*Automated monitoring of Polymarket prediction markets*  
+{ORDER_NOTE}
+
+**Started:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}  
+**Update Interval:** {Config.UPDATE_INTERVAL_MINUTES} minutes
+
+"""
+        
+        self._migrate_newest_first()
+        self._offsets = self._load_index()
         
     def write_market_data(self, market_data: Dict) -> bool:
         """
@@ -23,21 +113,18 @@ class MarkdownWriter:
             True if successful, False otherwise
         """
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            
-            # Read existing content if file exists
-            existing_content = self._read_existing_content()
+            # Create directory if it doesn't exist (checked once per process)
+            ensure_parent_dir(self.file_path)
             
             # Generate new entry
             new_entry = self._format_market_data(market_data)
             
-            # Combine with existing content
-            updated_content = self._combine_content(existing_content, new_entry)
+            # Append it to the end of the file
+            self._append_entry(new_entry)
             
-            # Write to file
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            # Drop the oldest entries once enough surplus has built up
+            if self.max_entries > 0 and len(self._offsets) - self.max_entries >= self._compact_slack:
+                self._compact()
             
             self.logger.info(f"Successfully wrote market data to {self.file_path}")
             return True
@@ -46,16 +133,146 @@ class MarkdownWriter:
             self.logger.error(f"Error writing market data to markdown: {e}")
             return False
     
-    def _read_existing_content(self) -> str:
-        """Read existing markdown content"""
+    def _append_entry(self, new_entry: str):
+        """Append a formatted entry, creating the header for a new file"""
+        # Pick up entries written by other writers since the last call
+        self._offsets = self._load_index()
+        
+        with open(self.file_path, 'ab') as f:
+            if f.tell() == 0:
+                self._offsets = []
+                f.write(self._create_header().encode('utf-8'))
+            
+            self._offsets.append(f.tell())
+            f.write(new_entry.encode('utf-8'))
+        
+        self._save_index()
+    
+    def _compact(self):
+        """Rewrite the file keeping only the newest max_entries entries"""
+        content = self._limit_entries(self._read_existing_content())
+        self._write_atomic(content)
+        
+        self._offsets = self._scan_offsets()
+        self._save_index()
+    
+    def _migrate_newest_first(self):
+        """Rewrite a file left newest first by older versions in oldest-first order"""
+        try:
+            # The order note sits in the header, so the start of the file
+            # tells whether the file needs migrating
+            with open(self.file_path, 'rb') as f:
+                head = f.read(LAST_ENTRY_READ_BYTES)
+        except OSError:
+            return
+        
+        first_entry = head.find(b'\n' + _ENTRY_MARKER_BYTES)
+        if first_entry == -1 or _ORDER_NOTE_BYTES in head[:first_entry]:
+            return
+        
+        content = self._read_existing_content()
+        bounds = [m.start() for m in _ENTRY_START_RE.finditer(content)] + [len(content)]
+        entries = [content[start:end] for start, end in zip(bounds, bounds[1:])]
+        
+        # Carry over the truncation note so the file still says it was
+        # trimmed. It is either in the header or, as the original writer
+        # left it, after a '---' line at the end of the oldest entry
+        note = None
+        note_start = content.find(b'\n' + _TRUNCATION_NOTE_PREFIX_BYTES, 0, first_entry)
+        if note_start != -1:
+            note = content[note_start:first_entry].strip(b'\n')
+        else:
+            trailing_note = b'\n---\n' + _TRUNCATION_NOTE_PREFIX_BYTES
+            note_start = entries[-1].rfind(trailing_note)
+            if note_start != -1:
+                note = entries[-1][note_start + len(b'\n---\n'):].strip(b'\n')
+                entries[-1] = entries[-1][:note_start].rstrip(b'\n') + b'\n\n'
+        
+        header = self._header.encode('utf-8')
+        if note:
+            header = header.rstrip(b'\n') + b'\n\n' + note + b'\n'
+        
+        self._write_atomic(header + b''.join(reversed(entries)))
+        self.logger.info(f"Rewrote {self.file_path} in oldest-first order ({len(entries)} entries)")
+    
+    def _write_atomic(self, data: bytes):
+        """Replace the markdown file without ever leaving it half-written"""
+        tmp_path = f"{self.file_path}.tmp"
+        
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            
+            # The rewritten file is not read again soon, keep it out of the page cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        
+        os.replace(tmp_path, self.file_path)
+    
+    def _load_index(self) -> List[int]:
+        """
+        Load the entry offsets from the sidecar index file
+        
+        The index is rebuilt from the markdown file when it is missing or
+        does not match the current file size.
+        
+        Returns:
+            Byte offsets of every entry in the file, oldest first
+        """
+        if not os.path.exists(self.file_path):
+            return []
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            
+            if index.get('size') == os.path.getsize(self.file_path):
+                return index['offsets']
+                
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.debug(f"Rebuilding markdown index: {e}")
+        
+        offsets = self._scan_offsets()
+        self._offsets = offsets
+        self._save_index()
+        return offsets
+    
+    def _save_index(self):
+        """Persist the entry offsets next to the markdown file"""
+        try:
+            index = {
+                'size': os.path.getsize(self.file_path),
+                'offsets': self._offsets
+            }
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+        except OSError as e:
+            self.logger.warning(f"Could not save markdown index: {e}")
+    
+    def _scan_offsets(self) -> List[int]:
+        """Find the byte offset of every entry by scanning the file"""
+        try:
+            with open(self.file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                
+                # Scan the page-cache backed mapping instead of copying the file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return [m.start() for m in _ENTRY_START_RE.finditer(mm)]
+        except OSError:
+            return []
+    
+    def _read_existing_content(self) -> bytes:
+        """Read existing markdown content as raw UTF-8 bytes"""
         try:
             if os.path.exists(self.file_path):
-                with open(self.file_path, 'r', encoding='utf-8') as f:
+                with open(self.file_path, 'rb') as f:
                     return f.read()
-            return ""
+            return b""
         except Exception as e:
             self.logger.warning(f"Could not read existing content: {e}")
-            return ""
+            return b""
     
     def _format_market_data(self, market_data: Dict) -> str:
         """Format market data as markdown"""
@@ -71,14 +288,10 @@ class MarkdownWriter:
             markets = market_data.get('markets', [])
             
             # Format timestamp for display
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-            except:
-                formatted_time = timestamp
+            formatted_time = _fmt_iso_to_utc(timestamp)
             
-            # Start building markdown
-            markdown = f"""
+            # Start building markdown, collecting fragments to join once
+            parts = [f"""
 ## 📊 Market Update - {formatted_time}
 
 ### 🎯 Market Information
@@ -92,138 +305,79 @@ class MarkdownWriter:
 ### 📝 Description
 {description}
 
-"""
+"""]
             
             # Add markets and prices
             if markets:
-                markdown += "### 💰 Market Prices\n\n"
+                parts.append("### 💰 Market Prices\n\n")
                 
                 for i, market in enumerate(markets, 1):
                     question = market.get('question', f'Market {i}')
                     outcomes = market.get('outcomes', [])
                     
-                    markdown += f"#### {question}\n\n"
+                    parts.append(f"#### {question}\n\n")
                     
                     if outcomes:
-                        markdown += "| Outcome | Price | Probability |\n"
-                        markdown += "|---------|-------|-------------|\n"
+                        parts.append(PRICE_TABLE_HEADER)
                         
-                        for outcome in outcomes:
-                            name = outcome.get('name', 'Unknown')
-                            price = outcome.get('price')
-                            
-                            if price is not None:
-                                try:
-                                    price_val = float(price)
-                                    if price_val <= 1:  # Assume it's already a probability
-                                        probability = f"{price_val:.1%}"
-                                        price_display = f"${price_val:.2f}"
-                                    else:  # Assume it's in cents
-                                        probability = f"{price_val:.1f}%"
-                                        price_display = f"{price_val}¢"
-                                except:
-                                    probability = "N/A"
-                                    price_display = str(price)
-                            else:
-                                probability = "N/A"
-                                price_display = "N/A"
-                            
-                            markdown += f"| {name} | {price_display} | {probability} |\n"
+                        parts.extend(
+                            _format_outcome_row(outcome.get('name', 'Unknown'), outcome.get('price'))
+                            for outcome in outcomes
+                        )
                         
-                        markdown += "\n"
+                        parts.append("\n")
                     else:
-                        markdown += "*No price data available*\n\n"
+                        parts.append("*No price data available*\n\n")
             else:
-                markdown += "### ⚠️ No Market Data Found\n\n"
-                markdown += "Could not extract market prices from the webpage.\n\n"
+                parts.append("### ⚠️ No Market Data Found\n\n")
+                parts.append("Could not extract market prices from the webpage.\n\n")
             
-            markdown += "---\n\n"
+            parts.append("---\n\n")
             
-            return markdown
+            return ''.join(parts)
             
         except Exception as e:
             self.logger.error(f"Error formatting market data: {e}")
             return f"\n## Error - {datetime.now().isoformat()}\nFailed to format market data: {e}\n\n---\n\n"
     
-    def _combine_content(self, existing_content: str, new_entry: str) -> str:
-        """Combine existing content with new entry"""
-        try:
-            # Create header if file is empty
-            if not existing_content.strip():
-                header = self._create_header()
-                content = header + new_entry
-            else:
-                # Add new entry at the top (after header)
-                lines = existing_content.split('\n')
-                
-                # Find where to insert (after the main header)
-                insert_index = 0
-                for i, line in enumerate(lines):
-                    if line.startswith('# ') and i == 0:
-                        # Found main header, insert after any description
-                        insert_index = i + 1
-                        # Skip description lines
-                        while (insert_index < len(lines) and 
-                               not lines[insert_index].startswith('##') and
-                               lines[insert_index].strip()):
-                            insert_index += 1
-                        break
-                
-                # Insert new entry
-                lines.insert(insert_index, new_entry)
-                content = '\n'.join(lines)
-            
-            # Limit number of entries if specified
-            if self.max_entries > 0:
-                content = self._limit_entries(content)
-            
-            return content
-            
-        except Exception as e:
-            self.logger.error(f"Error combining content: {e}")
-            return f"{existing_content}\n{new_entry}"
-    
     def _create_header(self) -> str:
         """Create markdown file header"""
-        return f"""# 🔥 Polymarket Price Monitor
-
-*Automated monitoring of Polymarket prediction markets*
-
-**Started:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}  
-**Update Interval:** {Config.UPDATE_INTERVAL_MINUTES} minutes
-
-"""
+        return self._header
     
-    def _limit_entries(self, content: str) -> str:
-        """Limit the number of entries in the file"""
+    def _limit_entries(self, content: bytes) -> bytes:
+        """Limit the number of entries in the file, keeping the newest"""
         try:
-            lines = content.split('\n')
-            header_lines = []
-            entry_starts = []
+            marker = b'\n' + _ENTRY_MARKER_BYTES
             
-            # Find header and entry boundaries
-            for i, line in enumerate(lines):
-                if line.startswith('# '):
-                    header_lines.append(i)
-                elif line.startswith('## 📊 Market Update'):
-                    entry_starts.append(i)
+            # Walk back from the end to the oldest entry that is kept; only
+            # max_entries searches are needed, whatever the file size
+            cutoff = len(content)
+            for _ in range(self.max_entries):
+                cutoff = content.rfind(marker, 0, cutoff)
+                if cutoff == -1:
+                    return content
             
-            # If we have too many entries, keep only the most recent
-            if len(entry_starts) > self.max_entries:
-                # Find where to cut off
-                cutoff_index = entry_starts[self.max_entries]
-                
-                # Keep everything before the cutoff
-                kept_lines = lines[:cutoff_index]
-                
-                # Add a note about truncated entries
-                kept_lines.append("---")
-                kept_lines.append(f"*Older entries truncated (showing last {self.max_entries} updates)*")
-                kept_lines.append("")
-                
-                content = '\n'.join(kept_lines)
+            # Nothing to drop if the oldest kept entry is also the first one
+            first_entry = content.find(marker)
+            if first_entry == cutoff:
+                return content
             
-            return content
+            # Keep the header, minus any previous truncation note
+            header = content[:first_entry]
+            note_start = header.find(b'\n' + _TRUNCATION_NOTE_PREFIX_BYTES)
+            if note_start != -1:
+                header = header[:note_start]
+            
+            # Splice header, note and the newest entries in one concatenation
+            note = (
+                f"\n\n{TRUNCATION_NOTE_PREFIX} (keeping the last {self.max_entries} updates, "
+                f"up to {self.max_entries + self._compact_slack} between trims)*\n"
+            )
+            return (
+                header.rstrip(b'\n') +
+                note.encode('utf-8') +
+                content[cutoff:]
+            )
             
         except Exception as e:
             self.logger.warning(f"Error limiting entries: {e}")
@@ -240,18 +394,18 @@ class MarkdownWriter:
             if not os.path.exists(self.file_path):
                 return None
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Only read the newest entry, which starts at the last offset
+            offsets = self._load_index()
+            if not offsets:
+                return None
             
-            # Look for the most recent timestamp
-            import re
-            pattern = r'## 📊 Market Update - (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC)'
-            matches = re.findall(pattern, content)
+            with open(self.file_path, 'rb') as f:
+                f.seek(offsets[-1])
+                head = f.read(LAST_ENTRY_READ_BYTES).decode('utf-8', 'ignore')
             
-            if matches:
-                # Parse the most recent timestamp
-                time_str = matches[0]
-                return datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S UTC')
+            match = _TS_RE.search(head)
+            if match:
+                return _parse_utc(match.group(1))
             
             return None
             
@@ -273,12 +427,8 @@ class MarkdownWriter:
             # Get file size
             file_size = os.path.getsize(self.file_path)
             
-            # Count entries
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            import re
-            entries = len(re.findall(r'## 📊 Market Update', content))
+            # Count entries from the offset index instead of reading the file
+            entries = len(self._load_index())
             
             return {
                 'exists': True,
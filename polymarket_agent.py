@@ -1,15 +1,22 @@
+import asyncio
+import json
 import logging
-import schedule
+import logging.handlers
 import time
-from datetime import datetime
 from config import Config
-from web_scraper_client import PolymarketWebScraper
 from markdown_writer import MarkdownWriter
 
 class PolymarketPriceAgent:
     """Main agent class for monitoring Polymarket prices and writing to markdown files"""
     
-    def __init__(self):
+    def __init__(self, polymarket_scraper=None, markdown_writer=None):
+        """
+        Initialize the agent
+        
+        Args:
+            polymarket_scraper: Optional existing PolymarketWebScraper to reuse
+            markdown_writer: Optional existing MarkdownWriter to reuse
+        """
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
@@ -21,19 +28,44 @@ class PolymarketPriceAgent:
             self.logger.error(f"Configuration validation failed: {e}")
             raise
         
-        # Initialize clients
-        self.polymarket_scraper = PolymarketWebScraper()
-        self.markdown_writer = MarkdownWriter()
+        # Resolve the target URL once; it is the single source of truth for
+        # updates and status reporting
+        self.url = Config.POLYMARKET_URL
+        
+        # Hash of the last market data written, used to skip unchanged ticks
+        self._last_hash = None
+        
+        # Initialize clients unless the caller already has them; the scraper
+        # (and BeautifulSoup) is only loaded once an update actually needs it
+        self._polymarket_scraper = polymarket_scraper
+        self.markdown_writer = markdown_writer or MarkdownWriter()
         
         self.logger.info("Polymarket Price Agent initialized successfully")
     
+    @property
+    def polymarket_scraper(self):
+        """Web scraper client, created on first use"""
+        if self._polymarket_scraper is None:
+            from web_scraper_client import PolymarketWebScraper
+            self._polymarket_scraper = PolymarketWebScraper()
+        return self._polymarket_scraper
+    
     def setup_logging(self):
         """Setup logging configuration"""
+        # Configure the root logger only once per process so repeated agent
+        # instances don't open extra file handles
+        if logging.getLogger().handlers:
+            return
+        
         logging.basicConfig(
-            level=getattr(logging, Config.LOG_LEVEL.upper()),
+            level=getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO),
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(Config.LOG_FILE),
+                logging.handlers.RotatingFileHandler(
+                    Config.LOG_FILE,
+                    maxBytes=10 * 1024 * 1024,
+                    backupCount=3
+                ),
                 logging.StreamHandler()
             ]
         )
@@ -44,7 +76,7 @@ class PolymarketPriceAgent:
             self.logger.info("Starting price data update...")
             
             # Get the URL to scrape
-            url = Config.POLYMARKET_URL
+            url = self.url
             if not url:
                 self.logger.error("No Polymarket URL configured")
                 return False
@@ -58,10 +90,21 @@ class PolymarketPriceAgent:
             
             self.logger.info(f"Scraped market data: {market_data.get('title', 'Unknown')}")
             
+            # Skip the write when nothing but the scrape timestamp changed
+            data_hash = hash(json.dumps(
+                {k: v for k, v in market_data.items() if k != 'timestamp'},
+                sort_keys=True,
+                default=str
+            ))
+            if data_hash == self._last_hash:
+                self.logger.info("Market data unchanged since last update, skipping write")
+                return True
+            
             # Write data to markdown file
             success = self.markdown_writer.write_market_data(market_data)
             
             if success:
+                self._last_hash = data_hash
                 self.logger.info("Successfully updated markdown file with price data")
                 return True
             else:
@@ -76,12 +119,11 @@ class PolymarketPriceAgent:
         """Run a single scheduled update with error handling"""
         try:
             self.logger.info("Running scheduled price update...")
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             success = self.update_price_data()
             
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             if success:
                 self.logger.info(f"Scheduled update completed successfully in {duration:.2f} seconds")
@@ -95,23 +137,11 @@ class PolymarketPriceAgent:
         """Start the monitoring process with scheduled updates"""
         self.logger.info(f"Starting Polymarket price monitoring...")
         self.logger.info(f"Update interval: {Config.UPDATE_INTERVAL_MINUTES} minutes")
-        self.logger.info(f"Target URL: {Config.POLYMARKET_URL}")
+        self.logger.info(f"Target URL: {self.url}")
         self.logger.info(f"Output file: {Config.MARKDOWN_FILE_PATH}")
         
-        # Schedule the job
-        schedule.every(Config.UPDATE_INTERVAL_MINUTES).minutes.do(self.run_scheduled_update)
-        
-        # Run an initial update
-        self.logger.info("Running initial price update...")
-        self.run_scheduled_update()
-        
-        # Start the scheduler loop
-        self.logger.info("Scheduler started. Waiting for next update...")
-        
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+            asyncio.run(self._run_scheduler())
                 
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal. Stopping agent...")
@@ -119,6 +149,21 @@ class PolymarketPriceAgent:
             self.logger.error(f"Unexpected error in scheduler loop: {e}")
             raise
     
+    async def _run_scheduler(self):
+        """Run an update immediately and then once every update interval"""
+        loop = asyncio.get_running_loop()
+        interval = Config.UPDATE_INTERVAL_MINUTES * 60
+        
+        self.logger.info("Running initial price update...")
+        while True:
+            next_run = loop.time() + interval
+            
+            # Updates do blocking I/O; run them off the event loop thread
+            await loop.run_in_executor(None, self.run_scheduled_update)
+            
+            self.logger.info("Waiting for next update...")
+            await asyncio.sleep(max(0, next_run - loop.time()))
+    
     def run_single_update(self):
         """Run a single update without scheduling (useful for testing)"""
         self.logger.info("Running single price update...")
@@ -134,13 +179,14 @@ class PolymarketPriceAgent:
             status = {
                 "agent_running": True,
                 "last_update": last_update.isoformat() if last_update else None,
-                "target_url": Config.POLYMARKET_URL,
+                "target_url": self.url,
                 "output_file": Config.MARKDOWN_FILE_PATH,
                 "update_interval_minutes": Config.UPDATE_INTERVAL_MINUTES,
                 "file_stats": file_stats
             }
             
-            self.logger.info(f"Agent status: {status}")
+            # Let logging format the status dict only if INFO is enabled
+            self.logger.info("Agent status: %s", status)
             return status
             
         except Exception as e:
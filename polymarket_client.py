@@ -1,18 +1,184 @@
 import requests
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import Dict, Optional, List
-from config import Config
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Dict, Optional, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from config import Config, ensure_parent_dir
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Market metadata rarely changes within a session; CLOB prices move quickly
+METADATA_CACHE_TTL_SECONDS = 600
+CLOB_CACHE_TTL_SECONDS = 5
+
+
+def ttl_cache(seconds: float):
+    """
+    Cache a client method's successful results for a limited time
+    
+    Results are stored on the instance's ``_cache`` keyed on the method name
+    and its arguments. Failed lookups (None) are not cached so they are
+    retried on the next call.
+    
+    Args:
+        seconds: How long a cached result stays valid
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args):
+            key = (func.__name__, args)
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < seconds:
+                return cached[1]
+            
+            result = func(self, *args)
+            if result is not None:
+                self._cache[key] = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
+
+
+def file_cache(seconds: float):
+    """
+    Persist a client method's successful results on disk for a limited time
+    
+    Each result is stored as ``{"ts": ..., "val": ...}`` in a JSON file under
+    ``Config.API_CACHE_DIR`` named after a hash of the method name and its
+    arguments, so fresh entries survive process restarts. Stale or unreadable
+    files are treated as misses.
+    
+    Args:
+        seconds: How long a cached result stays valid
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args):
+            key = json.dumps([func.__name__, args])
+            path = os.path.join(
+                Config.API_CACHE_DIR,
+                f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+            )
+            
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                if time.time() - entry['ts'] < seconds:
+                    return entry['val']
+                os.remove(path)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            
+            result = func(self, *args)
+            if result is not None:
+                tmp_path = None
+                try:
+                    ensure_parent_dir(path)
+                    # A unique temp file per writer, so concurrent misses on
+                    # the same key never rename each other's files away
+                    fd, tmp_path = tempfile.mkstemp(dir=Config.API_CACHE_DIR, suffix='.tmp')
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump({'ts': time.time(), 'val': result}, f)
+                    os.replace(tmp_path, path)
+                except (OSError, TypeError, ValueError) as e:
+                    self.logger.warning(f"Could not persist cached {func.__name__} result: {e}")
+                    if tmp_path is not None:
+                        try:
+                            os.remove(tmp_path)
+                        except OSError:
+                            pass
+            return result
+        return wrapper
+    return decorator
+
 
 class PolymarketClient:
     """Client for interacting with Polymarket Gamma API"""
     
+    __slots__ = (
+        'gamma_base_url', 'clob_base_url', '_events_url', '_markets_url',
+        '_clob_markets_url', 'session', 'logger', '_cache', '_executor'
+    )
+    
     def __init__(self):
         self.gamma_base_url = Config.POLYMARKET_GAMMA_API_BASE
         self.clob_base_url = Config.POLYMARKET_CLOB_API_BASE
+        self._events_url = f"{self.gamma_base_url}/events"
+        self._markets_url = f"{self.gamma_base_url}/markets"
+        self._clob_markets_url = f"{self.clob_base_url}/markets"
         self.session = requests.Session()
+        # Pool enough connections for the concurrent lookups and retry
+        # transient Gamma/CLOB failures instead of dropping the tick
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        self.session.mount('https://', adapter)
+        # Advertise every encoding urllib3 can decode here (adds br/zstd
+        # when brotli/zstandard are installed)
+        self.session.headers.update({'Accept-Encoding': ACCEPT_ENCODING})
         self.logger = logging.getLogger(__name__)
         
+        # TTL cache of API responses, see ttl_cache
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        
+        # Worker threads for issuing independent API calls concurrently
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='polymarket')
+    
+    def close(self):
+        """Shut down the worker threads and close the HTTP session"""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+    
+    def warm_up(self):
+        """
+        Open connections to the Gamma and CLOB hosts in the background
+        
+        Resolves DNS and completes the TLS handshakes ahead of the first
+        real request; the connections are then reused from the pool.
+        """
+        for base_url in (self.gamma_base_url, self.clob_base_url):
+            self._executor.submit(self._warm_up_host, base_url)
+    
+    def _warm_up_host(self, base_url: str):
+        """Send a lightweight HEAD request to base_url, ignoring failures"""
+        try:
+            self.session.head(base_url, timeout=3)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"Warm-up request to {base_url} failed: {e}")
+    
+    def cache_clear(self):
+        """Drop all in-memory cached API responses"""
+        self._cache.clear()
+        
+    def _cached(self, name: str, args: tuple, seconds: float):
+        """Return a fresh in-memory result cached by ttl_cache, or None"""
+        cached = self._cache.get((name, args))
+        if cached is not None and time.monotonic() - cached[0] < seconds:
+            return cached[1]
+        return None
+    
+    @ttl_cache(METADATA_CACHE_TTL_SECONDS)
+    @file_cache(METADATA_CACHE_TTL_SECONDS)
     def get_event_by_slug(self, slug: str) -> Optional[Dict]:
         """
         Fetch event data by slug
@@ -24,12 +190,10 @@ class PolymarketClient:
             Dictionary containing event data or None if failed
         """
         try:
-            url = f"{self.gamma_base_url}/events"
-            params = {"slug": slug}
-            response = self.session.get(url, params=params)
+            response = self.session.get(self._events_url, params={"slug": slug})
             response.raise_for_status()
             
-            events = response.json()
+            events = _json_loads(response.content)
             if events and len(events) > 0:
                 event_data = events[0]
                 self.logger.info(f"Successfully fetched event data for slug {slug}")
@@ -42,6 +206,8 @@ class PolymarketClient:
             self.logger.error(f"Error fetching event data: {e}")
             return None
     
+    @ttl_cache(METADATA_CACHE_TTL_SECONDS)
+    @file_cache(METADATA_CACHE_TTL_SECONDS)
     def get_markets_for_event(self, event_slug: str) -> Optional[List[Dict]]:
         """
         Fetch markets for a given event slug
@@ -53,12 +219,10 @@ class PolymarketClient:
             List of markets or None if failed
         """
         try:
-            url = f"{self.gamma_base_url}/markets"
-            params = {"event_slug": event_slug}
-            response = self.session.get(url, params=params)
+            response = self.session.get(self._markets_url, params={"event_slug": event_slug})
             response.raise_for_status()
             
-            markets = response.json()
+            markets = _json_loads(response.content)
             self.logger.info(f"Successfully fetched {len(markets)} markets for event {event_slug}")
             return markets
             
@@ -66,6 +230,38 @@ class PolymarketClient:
             self.logger.error(f"Error fetching markets for event: {e}")
             return None
     
+    def list_active_markets(self, limit: int = 5) -> Optional[List[Dict]]:
+        """
+        Fetch the highest-volume open markets
+        
+        Args:
+            limit: Maximum number of markets to return
+            
+        Returns:
+            List of markets or None if failed
+        """
+        try:
+            # Let Gamma filter and sort server-side instead of probing slugs
+            params = {
+                "active": "true",
+                "closed": "false",
+                "limit": limit,
+                "order": "volume",
+                "ascending": "false"
+            }
+            response = self.session.get(self._markets_url, params=params)
+            response.raise_for_status()
+            
+            markets = _json_loads(response.content)
+            self.logger.info(f"Successfully fetched {len(markets)} active markets")
+            return markets
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error fetching active markets: {e}")
+            return None
+    
+    @ttl_cache(METADATA_CACHE_TTL_SECONDS)
+    @file_cache(METADATA_CACHE_TTL_SECONDS)
     def get_market_by_slug(self, market_slug: str) -> Optional[Dict]:
         """
         Fetch market data by slug
@@ -77,12 +273,10 @@ class PolymarketClient:
             Dictionary containing market data or None if failed
         """
         try:
-            url = f"{self.gamma_base_url}/markets"
-            params = {"slug": market_slug}
-            response = self.session.get(url, params=params)
+            response = self.session.get(self._markets_url, params={"slug": market_slug})
             response.raise_for_status()
             
-            markets = response.json()
+            markets = _json_loads(response.content)
             if markets and len(markets) > 0:
                 market_data = markets[0]
                 self.logger.info(f"Successfully fetched market data for slug {market_slug}")
@@ -95,6 +289,7 @@ class PolymarketClient:
             self.logger.error(f"Error fetching market data: {e}")
             return None
     
+    @ttl_cache(CLOB_CACHE_TTL_SECONDS)
     def get_market_prices_from_clob(self, condition_id: str) -> Optional[Dict]:
         """
         Fetch current market prices from CLOB API
@@ -106,33 +301,31 @@ class PolymarketClient:
             Dictionary containing price data or None if failed
         """
         try:
-            # Get price information from CLOB
-            url = f"{self.clob_base_url}/markets"
-            response = self.session.get(url)
+            # Look the market up directly instead of scanning the full
+            # CLOB market list for the matching condition_id
+            response = self.session.get(f"{self._clob_markets_url}/{condition_id}")
+            if response.status_code == 404:
+                self.logger.warning(f"Market with condition_id {condition_id} not found in CLOB")
+                return None
             response.raise_for_status()
             
-            markets_data = response.json()
-            
-            # Find the market with matching condition_id
-            target_market = None
-            if 'data' in markets_data:
-                for market in markets_data['data']:
-                    if market.get('condition_id') == condition_id:
-                        target_market = market
-                        break
+            target_market = _json_loads(response.content)
             
             if not target_market:
                 self.logger.warning(f"Market with condition_id {condition_id} not found in CLOB")
                 return None
             
-            # Extract price information from tokens
-            prices = {}
-            if 'tokens' in target_market:
-                for token in target_market['tokens']:
-                    outcome = token.get('outcome', 'Unknown')
-                    # For now, we'll use a default price since the CLOB API 
-                    # might need additional endpoints for actual prices
-                    prices[outcome] = 0.5  # Placeholder
+            # Each CLOB token carries its outcome's current price; tokens
+            # without one are skipped rather than reported with a fake price
+            prices = {
+                token.get('outcome', 'Unknown'): float(token['price'])
+                for token in target_market.get('tokens', [])
+                if token.get('price') is not None
+            }
+            
+            if not prices:
+                self.logger.warning(f"No token prices for condition_id {condition_id} in CLOB")
+                return None
             
             return prices
             
@@ -140,6 +333,22 @@ class PolymarketClient:
             self.logger.error(f"Error fetching CLOB prices: {e}")
             return None
     
+    def get_market_prices_bulk(self, condition_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch current market prices for several markets concurrently
+        
+        Args:
+            condition_ids: Condition IDs of the markets
+            
+        Returns:
+            Dictionary mapping each condition ID to its price data (None if failed)
+        """
+        results = self._executor.map(self.get_market_prices_from_clob, condition_ids)
+        return dict(zip(condition_ids, results))
+    
+    # Shares the CLOB TTL so a cached result never holds staler prices than
+    # get_market_prices_from_clob would return
+    @ttl_cache(CLOB_CACHE_TTL_SECONDS)
     def get_simplified_price_data(self, event_or_market_slug: str) -> Optional[Dict]:
         """
         Get simplified price data suitable for Google Sheets
@@ -151,12 +360,23 @@ class PolymarketClient:
             Simplified dictionary with timestamp, market info, and prices
         """
         try:
-            # First try to get as market slug
-            market_data = self.get_market_by_slug(event_or_market_slug)
+            # A market already looked up needs no event lookup at all
+            market_data = self._cached(
+                'get_market_by_slug', (event_or_market_slug,), METADATA_CACHE_TTL_SECONDS
+            )
+            event_future = None
+            if market_data is None:
+                # The slug may be a market or an event slug; both lookups are
+                # independent, so issue them concurrently instead of one after
+                # the other. This always costs two Gamma requests, even when
+                # the market lookup matches.
+                market_future = self._executor.submit(self.get_market_by_slug, event_or_market_slug)
+                event_future = self._executor.submit(self.get_markets_for_event, event_or_market_slug)
+                market_data = market_future.result()
             
             if not market_data:
-                # Try to get markets for this event slug
-                markets = self.get_markets_for_event(event_or_market_slug)
+                # Fall back to the markets for this event slug
+                markets = event_future.result()
                 if markets and len(markets) > 0:
                     # Use the first market if multiple markets exist
                     market_data = markets[0]
@@ -167,7 +387,7 @@ class PolymarketClient:
             
             # Create simplified data structure
             simplified_data = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
                 'market_title': market_data.get('question', 'Unknown Market'),
                 'market_slug': market_data.get('market_slug', event_or_market_slug),
                 'condition_id': market_data.get('condition_id', 'Unknown'),
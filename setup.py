@@ -32,7 +32,11 @@ def install_dependencies():
     """Install required Python packages"""
     print("\n📦 Installing dependencies...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check", "--prefer-binary", "-q",
+            "-r", "requirements.txt"
+        ])
         print("✅ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError:
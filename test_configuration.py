@@ -5,111 +5,126 @@ This script helps verify that your configuration is working correctly.
 """
 
 import sys
-import logging
+from itertools import islice
 from config import Config
+from logging_setup import setup_once
 from polymarket_client import PolymarketClient
 from google_sheets_client import GoogleSheetsClient
 
-def test_configuration():
+# Outcome names reported directly as price fields
+PRICE_OUTCOMES = frozenset(('Yes', 'No'))
+
+def check_configuration():
     """Test the agent configuration"""
     print("🧪 Testing Polymarket Agent Configuration")
     print("=" * 50)
     
-    # Setup basic logging
-    logging.basicConfig(level=logging.INFO)
+    # Setup logging (shared by all test scripts)
+    setup_once()
     
     success = True
     
-    # Test 1: Configuration validation
-    print("\n1️⃣ Testing configuration validation...")
-    try:
-        Config.validate_config()
-        print("✅ Configuration validation passed")
-    except Exception as e:
-        print(f"❌ Configuration validation failed: {e}")
-        success = False
+    # Start connecting to the Polymarket APIs while the other checks run
+    client = PolymarketClient()
+    client.warm_up()
     
-    # Test 2: Polymarket API connection
-    print("\n2️⃣ Testing Polymarket API connection...")
     try:
-        client = PolymarketClient()
-        
-        # Determine which slug to use
-        slug = Config.POLYMARKET_MARKET_SLUG or Config.POLYMARKET_EVENT_SLUG
-        if not slug:
-            print("❌ No Polymarket slug configured")
+        # Test 1: Configuration validation
+        print("\n1️⃣ Testing configuration validation...")
+        try:
+            Config.validate_config()
+            print("✅ Configuration validation passed")
+        except Exception as e:
+            print(f"❌ Configuration validation failed: {e}")
             success = False
-        else:
-            print(f"   Using slug: {slug}")
-            
-            # Try to fetch data
-            data = client.get_simplified_price_data(slug)
-            if data:
-                print("✅ Successfully fetched Polymarket data")
-                print(f"   Market: {data.get('market_title', 'Unknown')}")
-                print(f"   Category: {data.get('category', 'Unknown')}")
-                print(f"   Active: {data.get('active', 'Unknown')}")
-                
-                # Show available price fields
-                price_fields = [k for k in data.keys() if k.endswith('_price') or k in ['Yes', 'No']]
-                if price_fields:
-                    print(f"   Price fields: {', '.join(price_fields)}")
-                else:
-                    print("   ⚠️  No price data available (this is normal for some markets)")
-            else:
-                print("❌ Failed to fetch Polymarket data")
+        
+        # Test 2: Polymarket API connection
+        print("\n2️⃣ Testing Polymarket API connection...")
+        try:
+            # Determine which slug to use
+            slug = Config.POLYMARKET_MARKET_SLUG or Config.POLYMARKET_EVENT_SLUG
+            if not slug:
+                print("❌ No Polymarket slug configured")
                 success = False
+            else:
+                print(f"   Using slug: {slug}")
                 
-    except Exception as e:
-        print(f"❌ Polymarket API test failed: {e}")
-        success = False
-    
-    # Test 3: Google Sheets connection
-    print("\n3️⃣ Testing Google Sheets connection...")
-    try:
-        sheets_client = GoogleSheetsClient()
-        
-        # Try to read existing data
-        data = sheets_client.get_sheet_data(f"{Config.GOOGLE_SHEET_NAME}!A1:A1")
-        print("✅ Successfully connected to Google Sheets")
+                # Try to fetch data
+                data = client.get_simplified_price_data(slug)
+                if data:
+                    print("✅ Successfully fetched Polymarket data")
+                    print(f"   Market: {data.get('market_title', 'Unknown')}")
+                    print(f"   Category: {data.get('category', 'Unknown')}")
+                    print(f"   Active: {data.get('active', 'Unknown')}")
+                    
+                    # Show available price fields
+                    price_fields = [k for k in data if k in PRICE_OUTCOMES or k.endswith('_price')]
+                    if price_fields:
+                        print(f"   Price fields: {', '.join(price_fields)}")
+                    else:
+                        print("   ⚠️  No price data available (this is normal for some markets)")
+                else:
+                    print("❌ Failed to fetch Polymarket data")
+                    success = False
+                    
+        except Exception as e:
+            print(f"❌ Polymarket API test failed: {e}")
+            success = False
         
-        if data:
-            print(f"   Sheet has existing data (first cell: {data[0][0] if data[0] else 'empty'})")
-        else:
-            print("   Sheet appears to be empty (this is normal for a new sheet)")
-            
-    except Exception as e:
-        print(f"❌ Google Sheets test failed: {e}")
-        success = False
-    
-    # Test 4: End-to-end test
-    print("\n4️⃣ Testing end-to-end data flow...")
-    if success:
+        # Test 3: Google Sheets connection
+        print("\n3️⃣ Testing Google Sheets connection...")
         try:
-            # Fetch data from Polymarket
-            slug = Config.POLYMARKET_MARKET_SLUG or Config.POLYMARKET_EVENT_SLUG
-            price_data = client.get_simplified_price_data(slug)
+            sheets_client = GoogleSheetsClient()
             
-            if price_data:
-                # Try to write to Google Sheets (but don't actually write)
-                print("✅ End-to-end test would succeed")
-                print("   Data structure looks good for Google Sheets")
-                
-                # Show what would be written
-                print("   Sample data that would be written:")
-                for key, value in list(price_data.items())[:5]:  # Show first 5 items
-                    print(f"      {key}: {value}")
-                if len(price_data) > 5:
-                    print(f"      ... and {len(price_data) - 5} more fields")
+            # Read the first cell and the timestamp column in one request
+            first_cell_range = f"{Config.GOOGLE_SHEET_NAME}!A1:A1"
+            column_range = f"{Config.GOOGLE_SHEET_NAME}!A:A"
+            results = sheets_client.batch_get([first_cell_range, column_range])
+            if results is None:
+                raise RuntimeError("could not read the sheet")
+            print("✅ Successfully connected to Google Sheets")
+            
+            data = results.get(first_cell_range)
+            if data:
+                print(f"   Sheet has existing data (first cell: {data[0][0] if data[0] else 'empty'})")
+                print(f"   Rows in use: {len(results.get(column_range, []))}")
             else:
-                print("❌ End-to-end test failed: no data to write")
-                success = False
+                print("   Sheet appears to be empty (this is normal for a new sheet)")
                 
         except Exception as e:
-            print(f"❌ End-to-end test failed: {e}")
+            print(f"❌ Google Sheets test failed: {e}")
             success = False
-    else:
-        print("⏭️  Skipping end-to-end test due to previous failures")
+        
+        # Test 4: End-to-end test
+        print("\n4️⃣ Testing end-to-end data flow...")
+        if success:
+            try:
+                # Fetch data from Polymarket
+                slug = Config.POLYMARKET_MARKET_SLUG or Config.POLYMARKET_EVENT_SLUG
+                price_data = client.get_simplified_price_data(slug)
+                
+                if price_data:
+                    # Try to write to Google Sheets (but don't actually write)
+                    print("✅ End-to-end test would succeed")
+                    print("   Data structure looks good for Google Sheets")
+                    
+                    # Show what would be written
+                    print("   Sample data that would be written:")
+                    for key, value in islice(price_data.items(), 5):  # Show first 5 items
+                        print(f"      {key}: {value}")
+                    if len(price_data) > 5:
+                        print(f"      ... and {len(price_data) - 5} more fields")
+                else:
+                    print("❌ End-to-end test failed: no data to write")
+                    success = False
+                    
+            except Exception as e:
+                print(f"❌ End-to-end test failed: {e}")
+                success = False
+        else:
+            print("⏭️  Skipping end-to-end test due to previous failures")
+    finally:
+        client.close()
     
     # Summary
     print("\n" + "=" * 50)
@@ -128,9 +143,13 @@ def test_configuration():
     
     return success
 
+def test_configuration():
+    """pytest entry point for the configuration checks"""
+    assert check_configuration()
+
 if __name__ == "__main__":
     try:
-        success = test_configuration()
+        success = check_configuration()
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted by user")
@@ -4,20 +4,81 @@ Test script for Polymarket Web Scraping Agent
 This script tests the web scraping functionality with the provided URL
 """
 
+import os
+import re
+import shutil
 import sys
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from config import Config
+from logging_setup import setup_once
+import web_scraper_client
 from web_scraper_client import PolymarketWebScraper
 from markdown_writer import MarkdownWriter
 
-def test_web_scraper():
+# Saved pages parsed by both HTML backends in check_parser_parity
+FIXTURE_PAGES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', name)
+    for name in ('market_page.html', 'fallback_page.html')
+]
+
+# Newest-first monitor file as written by the original markdown writer,
+# with its truncation note after the oldest entry
+LEGACY_MARKDOWN_FIXTURE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'legacy_newest_first.md'
+)
+
+def check_parser_parity():
+    """Check that selectolax and BeautifulSoup extract the same fields"""
+    print("🧩 Checking HTML parser parity")
+    print("=" * 50)
+    
+    lexbor_parser = web_scraper_client.LexborHTMLParser
+    if lexbor_parser is None:
+        print("⏭️  selectolax is not installed, only BeautifulSoup is in use")
+        return True
+    
+    scraper = PolymarketWebScraper()
+    success = True
+    try:
+        for path in FIXTURE_PAGES:
+            with open(path, 'rb') as f:
+                content = f.read()
+            
+            lexbor_fields = scraper._parse_page(content)
+            web_scraper_client.LexborHTMLParser = None
+            try:
+                soup_fields = scraper._parse_page(content)
+            finally:
+                web_scraper_client.LexborHTMLParser = lexbor_parser
+            
+            name = os.path.basename(path)
+            if not lexbor_fields['markets']:
+                print(f"❌ {name}: no markets extracted")
+                success = False
+            elif lexbor_fields != soup_fields:
+                print(f"❌ {name}: parsers disagree")
+                for key in lexbor_fields:
+                    if lexbor_fields[key] != soup_fields.get(key):
+                        print(f"   {key}: selectolax={lexbor_fields[key]!r} bs4={soup_fields.get(key)!r}")
+                success = False
+            else:
+                print(f"✅ {name}: both parsers agree")
+    finally:
+        scraper.close()
+    
+    return success
+
+def check_web_scraper():
     """Test the web scraping functionality"""
     print("🕸️  Testing Polymarket Web Scraper")
     print("=" * 50)
     
-    # Setup logging
-    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    # Setup logging (shared by all test scripts)
+    setup_once()
     
     try:
         # Test configuration
@@ -44,6 +105,11 @@ def test_web_scraper():
         # Test web scraping
         print("\n4️⃣ Testing web scraping...")
         print(f"   Scraping: {Config.POLYMARKET_URL}")
+        # Import the agent for step 6 in the background while the scrape
+        # waits on the network
+        import_executor = ThreadPoolExecutor(1)
+        import_future = import_executor.submit(__import__, 'polymarket_agent')
+        import_executor.shutdown(wait=False)
         market_data = scraper.extract_market_data(Config.POLYMARKET_URL)
         
         if not market_data:
@@ -51,29 +117,31 @@ def test_web_scraper():
             return False
         
         print("✅ Successfully scraped market data!")
-        print("\n📊 Extracted Data:")
-        print("-" * 30)
-        print(f"   Title: {market_data.get('title', 'N/A')}")
-        print(f"   Description: {market_data.get('description', 'N/A')[:100]}...")
-        print(f"   Volume: {market_data.get('volume', 'N/A')}")
-        print(f"   Liquidity: {market_data.get('liquidity', 'N/A')}")
-        print(f"   Status: {market_data.get('status', 'N/A')}")
-        print(f"   End Date: {market_data.get('end_date', 'N/A')}")
-        
-        # Show markets/outcomes
+        
+        # Build the whole summary first and emit it with a single write
         markets = market_data.get('markets', [])
-        print(f"   Markets Found: {len(markets)}")
+        lines = [
+            "\n📊 Extracted Data:",
+            "-" * 30,
+            f"   Title: {market_data.get('title', 'N/A')}",
+            f"   Description: {market_data.get('description', 'N/A')[:100]}...",
+            f"   Volume: {market_data.get('volume', 'N/A')}",
+            f"   Liquidity: {market_data.get('liquidity', 'N/A')}",
+            f"   Status: {market_data.get('status', 'N/A')}",
+            f"   End Date: {market_data.get('end_date', 'N/A')}",
+            f"   Markets Found: {len(markets)}"
+        ]
         
         for i, market in enumerate(markets[:3], 1):  # Show first 3
-            question = market.get('question', f'Market {i}')
             outcomes = market.get('outcomes', [])
-            print(f"     {i}. {question}")
-            print(f"        Outcomes: {len(outcomes)}")
-            
-            for outcome in outcomes[:3]:  # Show first 3 outcomes
-                name = outcome.get('name', 'Unknown')
-                price = outcome.get('price', 'N/A')
-                print(f"          - {name}: {price}")
+            lines.append(f"     {i}. {market.get('question', f'Market {i}')}")
+            lines.append(f"        Outcomes: {len(outcomes)}")
+            lines.extend(
+                f"          - {outcome.get('name', 'Unknown')}: {outcome.get('price', 'N/A')}"
+                for outcome in outcomes[:3]  # Show first 3 outcomes
+            )
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Test markdown writing
         print("\n5️⃣ Testing markdown writing...")
@@ -94,9 +162,10 @@ def test_web_scraper():
         
         # Test end-to-end with agent
         print("\n6️⃣ Testing full agent workflow...")
-        from polymarket_agent import PolymarketPriceAgent
+        PolymarketPriceAgent = import_future.result().PolymarketPriceAgent
         
-        agent = PolymarketPriceAgent()
+        # Reuse the scraper and writer built above instead of new instances
+        agent = PolymarketPriceAgent(polymarket_scraper=scraper, markdown_writer=writer)
         result = agent.run_single_update()
         
         if result:
@@ -104,17 +173,19 @@ def test_web_scraper():
             
             # Show final file content preview
             try:
+                # Read only the preview lines, then count the rest in raw
+                # 64 KB chunks instead of loading the whole file
                 with open(Config.MARKDOWN_FILE_PATH, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    preview_lines = lines[:20]  # Show first 20 lines
+                    preview_lines = [line.rstrip('\n') for line in islice(f, 20)]
+                with open(Config.MARKDOWN_FILE_PATH, 'rb') as f:
+                    total_lines = 1 + sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 16), b''))
                     
                 print("\n📄 Markdown File Preview (first 20 lines):")
                 print("-" * 40)
                 for line in preview_lines:
                     print(line)
-                if len(lines) > 20:
-                    print(f"... and {len(lines) - 20} more lines")
+                if total_lines > 20:
+                    print(f"... and {total_lines - 20} more lines")
                     
             except Exception as e:
                 print(f"⚠️  Could not read file for preview: {e}")
@@ -131,13 +202,64 @@ def test_web_scraper():
         
     except Exception as e:
         print(f"\n💥 Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The traceback is only formatted if a handler accepts the record
+        logging.getLogger(__name__).exception("Web scraper test failed")
         return False
 
+def check_markdown_migration():
+    """Check that a newest-first monitor file is rewritten oldest first"""
+    print("🗂️  Checking markdown migration")
+    print("=" * 50)
+    
+    original_path = Config.MARKDOWN_FILE_PATH
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'monitor.md')
+        shutil.copyfile(LEGACY_MARKDOWN_FIXTURE, path)
+        
+        Config.MARKDOWN_FILE_PATH = path
+        try:
+            writer = MarkdownWriter()
+            last_update = writer.get_last_update_time()
+        finally:
+            Config.MARKDOWN_FILE_PATH = original_path
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    
+    timestamps = re.findall(r'## 📊 Market Update - (.+?) UTC', content)
+    first_entry = content.find('## 📊 Market Update')
+    note_count = content.count('*Older entries truncated')
+    
+    success = True
+    if timestamps != sorted(timestamps):
+        print(f"❌ Entries are not oldest first: {timestamps}")
+        success = False
+    if not last_update or last_update.strftime('%Y-%m-%d %H:%M:%S') != timestamps[-1]:
+        print(f"❌ Last update {last_update} is not the newest entry {timestamps[-1]}")
+        success = False
+    if note_count != 1 or content.find('*Older entries truncated') > first_entry:
+        print("❌ Truncation note was not moved into the header")
+        success = False
+    
+    if success:
+        print(f"✅ {len(timestamps)} entries migrated, truncation note kept in the header")
+    return success
+
+def test_markdown_migration():
+    """pytest entry point for the markdown migration check"""
+    assert check_markdown_migration()
+
+def test_parser_parity():
+    """pytest entry point for the parser parity check"""
+    assert check_parser_parity()
+
+def test_web_scraper():
+    """pytest entry point for the web scraper checks"""
+    assert check_web_scraper()
+
 if __name__ == "__main__":
     try:
-        success = test_web_scraper()
+        success = check_parser_parity() and check_markdown_migration() and check_web_scraper()
         
         if success:
             print(f"\n🚀 Next steps:")
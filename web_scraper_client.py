@@ -1,75 +1,252 @@
 import requests
+import hashlib
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import re
 import json
 from config import Config
 
-class PolymarketWebScraper:
-    """Client for scraping Polymarket website data"""
+# lxml builds the tree far faster than the pure-Python parser; it is
+# optional, so fall back to html.parser when it isn't installed
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# selectolax parses and runs selectors in C (lexbor) and is much faster
+# again than BeautifulSoup with lxml; also optional
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# (connect, read) timeout in seconds for page requests
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Pages larger than this are abandoned rather than buffered and parsed
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Patterns are compiled once at import instead of on every call
+_PRICE_RE = re.compile(r'(\d+(?:\.\d+)?)[¢%]?')
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_PRICE_SUB_RE = re.compile(r'\d+(?:\.\d+)?[¢%]?')
+_PCT_SUB_RE = re.compile(r'\d+(?:\.\d+)?%')
+_FALLBACK_PRICE_RE = re.compile(r'\d+[¢%]|\d+\.\d+')
+# Page text patterns are paired with a lowercase word each match must
+# contain, so a substring test can rule a pattern out before running it
+_VOLUME_PATTERNS = [
+    ('volume', re.compile(pattern, re.IGNORECASE)) for pattern in (
+        r'Volume[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
+        r'Total volume[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
+        r'\$?([\d,]+(?:\.\d+)?[KMB]?)\s*volume'
+    )
+]
+_LIQUIDITY_PATTERNS = [
+    ('liquidity', re.compile(pattern, re.IGNORECASE)) for pattern in (
+        r'Liquidity[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
+        r'Total liquidity[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
+        r'\$?([\d,]+(?:\.\d+)?[KMB]?)\s*liquidity'
+    )
+]
+_DATE_PATTERNS = [
+    (anchor, re.compile(pattern, re.IGNORECASE)) for anchor, pattern in (
+        ('ends', r'Ends[:\s]*([\w\s,]+\d{4})'),
+        ('closes', r'Closes[:\s]*([\w\s,]+\d{4})'),
+        ('end date', r'End date[:\s]*([\w\s,]+\d{4})')
+    )
+]
+
+# Element lookups as (tag name, attrs) pairs for find/find_all, tried in order;
+# these avoid routing simple selectors through the CSS selector engine
+_MARKET_TESTID_RE = re.compile('market')
+_OUTCOME_TESTID_RE = re.compile('outcome')
+_STATUS_TESTID_RE = re.compile('status')
+_STATUS_LOOKUPS = (
+    (None, {'data-testid': _STATUS_TESTID_RE}),
+    (None, {'class': 'status'}),
+    (None, {'class': 'market-status'})
+)
+_TITLE_LOOKUPS = (
+    ('h1', {}),
+    (None, {'data-testid': 'event-title'}),
+    (None, {'class': 'event-title'}),
+    ('title', {})
+)
+_DESCRIPTION_LOOKUPS = (
+    (None, {'data-testid': 'event-description'}),
+    (None, {'class': 'event-description'}),
+    (None, {'class': 'description'}),
+    ('meta', {'name': 'description'})
+)
+_MARKET_LOOKUPS = (
+    (None, {'data-testid': _MARKET_TESTID_RE}),
+    (None, {'class': 'market-card'}),
+    (None, {'class': 'market-item'}),
+    (None, {'class': 'outcome-card'})
+)
+_QUESTION_LOOKUPS = (
+    ('h2', {}),
+    ('h3', {}),
+    (None, {'class': 'question'}),
+    (None, {'class': 'market-title'})
+)
+_OUTCOME_LOOKUPS = (
+    (None, {'class': 'outcome-button'}),
+    (None, {'class': 'bet-button'}),
+    (None, {'data-testid': _OUTCOME_TESTID_RE}),
+    (None, {'class': 'price-button'})
+)
+
+class _LexborNode:
+    """
+    Wrap a selectolax node in the small part of the BeautifulSoup API the
+    extractors use, so both parsers share one set of extraction rules
+    """
+    
+    __slots__ = ('_node',)
+    
+    # (name, attrs) lookups translated to CSS selectors, built on first use
+    _selectors: Dict[tuple, str] = {}
+    
+    def __init__(self, node):
+        self._node = node
+    
+    @classmethod
+    def _selector(cls, name: Optional[str], attrs: Optional[Dict]) -> str:
+        key = (name, tuple((attrs or {}).items()))
+        selector = cls._selectors.get(key)
+        if selector is None:
+            selector = name or ''
+            for attr, value in (attrs or {}).items():
+                if attr == 'class':
+                    selector += f'.{value}'
+                elif isinstance(value, re.Pattern):
+                    # Lookup patterns are plain substrings
+                    selector += f'[{attr}*="{value.pattern}"]'
+                else:
+                    selector += f'[{attr}="{value}"]'
+            cls._selectors[key] = selector = selector or '*'
+        return selector
+    
+    @property
+    def name(self) -> str:
+        return self._node.tag
+    
+    @property
+    def mem_id(self) -> int:
+        """Identity of the wrapped node; wrappers are created per lookup"""
+        return self._node.mem_id
+    
+    @property
+    def parent(self) -> Optional['_LexborNode']:
+        parent = self._node.parent
+        return _LexborNode(parent) if parent is not None else None
+    
+    @property
+    def title(self) -> Optional['_LexborNode']:
+        return self.find('title')
+    
+    @property
+    def string(self) -> str:
+        return self._node.text()
+    
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+    
+    def get_text(self, strip: bool = False) -> str:
+        return self._node.text(strip=strip)
+    
+    def find(self, name: Optional[str] = None, attrs: Optional[Dict] = None) -> Optional['_LexborNode']:
+        found = self.find_all(name, attrs, limit=1)
+        return found[0] if found else None
+    
+    def find_all(self, name: Optional[str] = None, attrs: Optional[Dict] = None,
+                 string=None, limit: Optional[int] = None) -> List['_LexborNode']:
+        if string is not None:
+            # Text nodes whose content matches, returned as their own nodes
+            # so .parent gives the containing element
+            matches = (
+                node for node in self._node.traverse(include_text=True)
+                if node.tag == '-text' and string.search(node.text_content or '')
+            )
+        else:
+            # Unlike BeautifulSoup, css() also matches the node itself
+            matches = (
+                node for node in self._node.css(self._selector(name, attrs))
+                if node != self._node
+            )
+        
+        found = []
+        for node in matches:
+            found.append(_LexborNode(node))
+            if limit and len(found) >= limit:
+                break
+        return found
+
+
+class _PageParser:
+    """
+    Turn Polymarket webpage HTML into market fields
+    
+    Holds no HTTP state, so worker processes can parse pages without
+    building a scraper and its session.
+    """
+    
+    __slots__ = ('logger',)
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
         self.logger = logging.getLogger(__name__)
-        
-    def extract_market_data(self, url: str) -> Optional[Dict]:
+    
+    def _parse_page(self, content: bytes) -> Dict:
         """
-        Extract market data from Polymarket webpage
+        Parse a Polymarket webpage into its market fields
         
         Args:
-            url: The Polymarket market/event URL
+            content: Raw HTML of the page
             
         Returns:
-            Dictionary containing market data or None if failed
+            Dictionary of the extracted fields (without url and timestamp)
         """
-        try:
-            self.logger.info(f"Scraping market data from: {url}")
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract basic market information
-            market_data = {
-                'url': url,
-                'timestamp': datetime.now().isoformat(),
-                'title': self._extract_title(soup),
-                'description': self._extract_description(soup),
-                'markets': self._extract_markets(soup),
-                'volume': self._extract_volume(soup),
-                'liquidity': self._extract_liquidity(soup),
-                'end_date': self._extract_end_date(soup),
-                'status': self._extract_status(soup)
-            }
-            
-            self.logger.info(f"Successfully extracted market data: {market_data['title']}")
-            return market_data
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error fetching webpage: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error parsing market data: {e}")
-            return None
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(content)
+            # BeautifulSoup leaves script and style contents out of its text
+            tree.strip_tags(['script', 'style'])
+            soup = _LexborNode(tree.root)
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER)
+        
+        # Walk the DOM for the page text once and share it between the
+        # text-based extractors, along with a lowercase copy for their
+        # cheap substring checks
+        page_text = soup.get_text()
+        page_text_lower = page_text.lower()
+        
+        return {
+            'title': self._extract_title(soup),
+            'description': self._extract_description(soup),
+            'markets': self._extract_markets(soup),
+            'volume': self._extract_volume(page_text, page_text_lower),
+            'liquidity': self._extract_liquidity(page_text, page_text_lower),
+            'end_date': self._extract_end_date(page_text, page_text_lower),
+            'status': self._extract_status(soup, page_text_lower)
+        }
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract the main title/question from the page"""
         try:
             # Try multiple selectors for title
-            selectors = [
-                'h1',
-                '[data-testid="event-title"]',
-                '.event-title',
-                'title'
-            ]
-            
-            for selector in selectors:
-                element = soup.select_one(selector)
+            for name, attrs in _TITLE_LOOKUPS:
+                element = soup.find(name, attrs)
                 if element:
                     title = element.get_text(strip=True)
                     if title and len(title) > 5:  # Reasonable title length
@@ -83,22 +260,15 @@ class PolymarketWebScraper:
             return "Unknown Market"
             
         except Exception as e:
-            self.logger.warning(f"Could not extract title: {e}")
+            self.logger.warning("Could not extract title: %s", e)
             return "Unknown Market"
     
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract market description"""
         try:
             # Look for description in various places
-            selectors = [
-                '[data-testid="event-description"]',
-                '.event-description',
-                '.description',
-                'meta[name="description"]'
-            ]
-            
-            for selector in selectors:
-                element = soup.select_one(selector)
+            for name, attrs in _DESCRIPTION_LOOKUPS:
+                element = soup.find(name, attrs)
                 if element:
                     if element.name == 'meta':
                         return element.get('content', '').strip()
@@ -110,7 +280,7 @@ class PolymarketWebScraper:
             return "No description available"
             
         except Exception as e:
-            self.logger.warning(f"Could not extract description: {e}")
+            self.logger.warning("Could not extract description: %s", e)
             return "No description available"
     
     def _extract_markets(self, soup: BeautifulSoup) -> List[Dict]:
@@ -119,20 +289,10 @@ class PolymarketWebScraper:
             markets = []
             
             # Look for market containers
-            market_selectors = [
-                '[data-testid*="market"]',
-                '.market-card',
-                '.market-item',
-                '.outcome-card'
-            ]
-            
-            for selector in market_selectors:
-                elements = soup.select(selector)
+            for name, attrs in _MARKET_LOOKUPS:
+                elements = soup.find_all(name, attrs)
                 if elements:
-                    for element in elements:
-                        market = self._parse_market_element(element)
-                        if market:
-                            markets.append(market)
+                    markets.extend(filter(None, map(self._parse_market_element, elements)))
                     break
             
             # If no structured markets found, look for price elements
@@ -142,7 +302,7 @@ class PolymarketWebScraper:
             return markets
             
         except Exception as e:
-            self.logger.warning(f"Could not extract markets: {e}")
+            self.logger.warning("Could not extract markets: %s", e)
             return []
     
     def _parse_market_element(self, element) -> Optional[Dict]:
@@ -151,9 +311,8 @@ class PolymarketWebScraper:
             market = {}
             
             # Extract question/title
-            question_selectors = ['h2', 'h3', '.question', '.market-title']
-            for selector in question_selectors:
-                q_elem = element.select_one(selector)
+            for name, attrs in _QUESTION_LOOKUPS:
+                q_elem = element.find(name, attrs)
                 if q_elem:
                     market['question'] = q_elem.get_text(strip=True)
                     break
@@ -162,15 +321,8 @@ class PolymarketWebScraper:
             outcomes = []
             
             # Look for outcome buttons or cards
-            outcome_selectors = [
-                '.outcome-button',
-                '.bet-button',
-                '[data-testid*="outcome"]',
-                '.price-button'
-            ]
-            
-            for selector in outcome_selectors:
-                outcome_elements = element.select(selector)
+            for name, attrs in _OUTCOME_LOOKUPS:
+                outcome_elements = element.find_all(name, attrs)
                 if outcome_elements:
                     for outcome_elem in outcome_elements:
                         outcome = self._parse_outcome_element(outcome_elem)
@@ -185,7 +337,7 @@ class PolymarketWebScraper:
             return None
             
         except Exception as e:
-            self.logger.warning(f"Error parsing market element: {e}")
+            self.logger.warning("Error parsing market element: %s", e)
             return None
     
     def _parse_outcome_element(self, element) -> Optional[Dict]:
@@ -196,13 +348,14 @@ class PolymarketWebScraper:
             # Extract outcome name
             text = element.get_text(strip=True)
             
-            # Try to extract price (look for percentage or decimal)
-            price_match = re.search(r'(\d+(?:\.\d+)?)[¢%]?', text)
-            percentage_match = re.search(r'(\d+(?:\.\d+)?)%', text)
+            # Try to extract price (look for percentage or decimal); a
+            # percentage anywhere wins, so only scan for one when '%' appears
+            percentage_match = _PCT_RE.search(text) if '%' in text else None
+            price_match = None if percentage_match else _PRICE_RE.search(text)
             
             if percentage_match:
                 outcome['price'] = float(percentage_match.group(1)) / 100
-                outcome['name'] = re.sub(r'\d+(?:\.\d+)?%', '', text).strip()
+                outcome['name'] = _PCT_SUB_RE.sub('', text).strip()
             elif price_match:
                 price_val = float(price_match.group(1))
                 # If it's cents (¢), convert to dollars
@@ -212,7 +365,7 @@ class PolymarketWebScraper:
                 elif price_val > 100:
                     price_val = price_val / 100
                 outcome['price'] = price_val
-                outcome['name'] = re.sub(r'\d+(?:\.\d+)?[¢%]?', '', text).strip()
+                outcome['name'] = _PRICE_SUB_RE.sub('', text).strip()
             
             # If no price found, try to extract just the name
             if 'name' not in outcome:
@@ -222,7 +375,7 @@ class PolymarketWebScraper:
             return outcome if outcome.get('name') else None
             
         except Exception as e:
-            self.logger.warning(f"Error parsing outcome: {e}")
+            self.logger.warning("Error parsing outcome: %s", e)
             return None
     
     def _extract_prices_fallback(self, soup: BeautifulSoup) -> List[Dict]:
@@ -230,8 +383,9 @@ class PolymarketWebScraper:
         try:
             markets = []
             
-            # Look for any elements containing prices
-            price_elements = soup.find_all(text=re.compile(r'\d+[¢%]|\d+\.\d+'))
+            # Look for any elements containing prices; limit stops the walk
+            # once enough are found instead of scanning the whole document
+            price_elements = soup.find_all(string=_FALLBACK_PRICE_RE, limit=10)
             
             if price_elements:
                 market = {
@@ -239,13 +393,21 @@ class PolymarketWebScraper:
                     'outcomes': []
                 }
                 
-                for i, price_elem in enumerate(price_elements[:10]):  # Limit to 10
+                # Several price strings often sit in one element; parse each
+                # parent once instead of once per string
+                seen = set()
+                for price_elem in price_elements:
                     parent = price_elem.parent
-                    if parent:
-                        text = parent.get_text(strip=True)
-                        outcome = self._parse_outcome_element(parent)
-                        if outcome:
-                            market['outcomes'].append(outcome)
+                    if parent is None:
+                        continue
+                    key = parent.mem_id if isinstance(parent, _LexborNode) else id(parent)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    
+                    outcome = self._parse_outcome_element(parent)
+                    if outcome:
+                        market['outcomes'].append(outcome)
                 
                 if market['outcomes']:
                     markets.append(market)
@@ -253,90 +415,302 @@ class PolymarketWebScraper:
             return markets
             
         except Exception as e:
-            self.logger.warning(f"Error in fallback price extraction: {e}")
+            self.logger.warning("Error in fallback price extraction: %s", e)
             return []
     
-    def _extract_volume(self, soup: BeautifulSoup) -> str:
+    def _extract_volume(self, page_text: str, page_text_lower: str) -> str:
         """Extract trading volume"""
         try:
-            # Look for volume indicators
-            volume_patterns = [
-                r'Volume[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
-                r'Total volume[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
-                r'\$?([\d,]+(?:\.\d+)?[KMB]?)\s*volume'
-            ]
-            
-            page_text = soup.get_text()
-            
-            for pattern in volume_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for anchor, pattern in _VOLUME_PATTERNS:
+                if anchor not in page_text_lower:
+                    continue
+                match = pattern.search(page_text)
                 if match:
                     return f"${match.group(1)}"
             
             return "Volume not found"
             
         except Exception as e:
-            self.logger.warning(f"Could not extract volume: {e}")
+            self.logger.warning("Could not extract volume: %s", e)
             return "Volume not found"
     
-    def _extract_liquidity(self, soup: BeautifulSoup) -> str:
+    def _extract_liquidity(self, page_text: str, page_text_lower: str) -> str:
         """Extract liquidity information"""
         try:
-            # Look for liquidity indicators
-            liquidity_patterns = [
-                r'Liquidity[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
-                r'Total liquidity[:\s]*\$?([\d,]+(?:\.\d+)?[KMB]?)',
-                r'\$?([\d,]+(?:\.\d+)?[KMB]?)\s*liquidity'
-            ]
-            
-            page_text = soup.get_text()
-            
-            for pattern in liquidity_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for anchor, pattern in _LIQUIDITY_PATTERNS:
+                if anchor not in page_text_lower:
+                    continue
+                match = pattern.search(page_text)
                 if match:
                     return f"${match.group(1)}"
             
             return "Liquidity not found"
             
         except Exception as e:
-            self.logger.warning(f"Could not extract liquidity: {e}")
+            self.logger.warning("Could not extract liquidity: %s", e)
             return "Liquidity not found"
     
-    def _extract_end_date(self, soup: BeautifulSoup) -> str:
+    def _extract_end_date(self, page_text: str, page_text_lower: str) -> str:
         """Extract market end date"""
         try:
-            # Look for date patterns
-            date_patterns = [
-                r'Ends[:\s]*([\w\s,]+\d{4})',
-                r'Closes[:\s]*([\w\s,]+\d{4})',
-                r'End date[:\s]*([\w\s,]+\d{4})'
-            ]
-            
-            page_text = soup.get_text()
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for anchor, pattern in _DATE_PATTERNS:
+                if anchor not in page_text_lower:
+                    continue
+                match = pattern.search(page_text)
                 if match:
                     return match.group(1).strip()
             
             return "End date not found"
             
         except Exception as e:
-            self.logger.warning(f"Could not extract end date: {e}")
+            self.logger.warning("Could not extract end date: %s", e)
             return "End date not found"
     
-    def _extract_status(self, soup: BeautifulSoup) -> str:
+    def _extract_status(self, soup: BeautifulSoup, page_text_lower: str) -> str:
         """Extract market status"""
         try:
-            page_text = soup.get_text().lower()
+            # Status badges and the page title are short and far more
+            # specific than the page text, so check them first
+            for name, attrs in _STATUS_LOOKUPS:
+                for element in soup.find_all(name, attrs):
+                    status = self._status_from_text(element.get_text(strip=True).lower())
+                    if status:
+                        return status
+            
+            if soup.title and soup.title.string:
+                status = self._status_from_text(soup.title.string.lower())
+                if status:
+                    return status
+            
+            return self._status_from_text(page_text_lower) or "Unknown"
+                
+        except Exception as e:
+            self.logger.warning("Could not extract status: %s", e)
+            return "Unknown"
+    
+    @staticmethod
+    def _status_from_text(text: str) -> Optional[str]:
+        """Map lowercase text mentioning a market state to a status, or None"""
+        if 'closed' in text or 'ended' in text:
+            return "Closed"
+        elif 'active' in text or 'live' in text:
+            return "Active"
+        return None
+
+
+class PolymarketWebScraper(_PageParser):
+    """Client for scraping Polymarket website data"""
+    
+    __slots__ = ('session', '_page_cache', '_process_pool')
+    
+    def __init__(self):
+        super().__init__()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        # Keep enough pooled keep-alive connections for extract_many and
+        # retry transient failures instead of failing the scrape
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Last response per URL: (ETag, Last-Modified, body digest, parsed
+        # fields), used for conditional requests and to skip re-parsing
+        self._page_cache: Dict[str, tuple] = {}
+        
+        # Worker processes for extract_many(parse_in_processes=True),
+        # started on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+    
+    def close(self):
+        """Shut down the parsing worker processes and close the HTTP session"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+        self.session.close()
+        
+    def extract_market_data(self, url: str) -> Optional[Dict]:
+        """
+        Extract market data from Polymarket webpage
+        
+        Args:
+            url: The Polymarket market/event URL
             
-            if 'closed' in page_text or 'ended' in page_text:
-                return "Closed"
-            elif 'active' in page_text or 'live' in page_text:
-                return "Active"
+        Returns:
+            Dictionary containing market data or None if failed
+        """
+        return self._extract(url, self._parse_page)
+    
+    def _extract(self, url: str, parse: Callable[[bytes], Dict]) -> Optional[Dict]:
+        """
+        Fetch a Polymarket webpage and extract its market data
+        
+        Args:
+            url: The Polymarket market/event URL
+            parse: Turns the page HTML into the extracted fields
+            
+        Returns:
+            Dictionary containing market data or None if failed
+        """
+        try:
+            self.logger.info("Scraping market data from: %s", url)
+            cached = self._page_cache.get(url)
+            
+            # Revalidate the previous response so an unchanged page comes
+            # back as an empty 304
+            headers = {}
+            if cached:
+                etag, last_modified = cached[0], cached[1]
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            # Stream the body so an oversized page is dropped as soon as it
+            # crosses the cap instead of being held in memory whole
+            with self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT,
+                                  stream=True) as response:
+                response.raise_for_status()
+                not_modified = bool(cached) and response.status_code == 304
+                content = None if not_modified else self._read_body(response)
+            
+            if not_modified:
+                self.logger.info("Page not modified, reusing previously extracted data")
+                fields = cached[3]
             else:
-                return "Unknown"
-                
+                # Servers without validators still often return identical
+                # bodies; only parse when the content actually changed
+                if content is None:
+                    return None
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if cached and cached[2] == digest:
+                    self.logger.info("Page content unchanged, reusing previously extracted data")
+                    fields = cached[3]
+                else:
+                    fields = parse(content)
+                self._page_cache[url] = (
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    digest,
+                    fields
+                )
+            
+            market_data = {
+                'url': url,
+                'timestamp': datetime.now().isoformat(),
+                **fields
+            }
+            
+            self.logger.info("Successfully extracted market data: %s", market_data['title'])
+            return market_data
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Error fetching webpage: %s", e)
+            return None
         except Exception as e:
-            self.logger.warning(f"Could not extract status: {e}")
-            return "Unknown"
\ No newline at end of file
+            self.logger.error("Error parsing market data: %s", e)
+            return None
+    
+    def _read_body(self, response: requests.Response) -> Optional[bytes]:
+        """
+        Read a streamed response body, giving up past MAX_PAGE_BYTES
+        
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            The body bytes or None if the page is too large
+        """
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+            self.logger.error("Page too large (%s bytes), skipping: %s", content_length, response.url)
+            return None
+        
+        # Content-Length may be missing or describe the compressed size, so
+        # enforce the cap on the decoded bytes as well
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(65536):
+            size += len(chunk)
+            if size > MAX_PAGE_BYTES:
+                self.logger.error("Page exceeded %s bytes, skipping: %s", MAX_PAGE_BYTES, response.url)
+                return None
+            chunks.append(chunk)
+        
+        return b''.join(chunks)
+    
+    def extract_many(self, urls: List[str], max_workers: int = 8,
+                     parse_in_processes: bool = False) -> Dict[str, Optional[Dict]]:
+        """
+        Extract market data from several Polymarket webpages concurrently
+        
+        Args:
+            urls: The Polymarket market/event URLs
+            max_workers: Maximum number of pages fetched at the same time
+            parse_in_processes: Parse pages in worker processes so parsing
+                uses every core; worth the process start-up on large batches
+            
+        Returns:
+            Dictionary mapping each URL to its market data (None if failed)
+        """
+        if not urls:
+            return {}
+        
+        extract = self.extract_market_data
+        if parse_in_processes:
+            # Parsing holds the GIL, so with threads alone it runs on one
+            # core; hand each fetched page to a worker process instead
+            if self._process_pool is None:
+                # Workers are first started from the fetch threads, and
+                # forking a multi-threaded process is unsafe; start them
+                # from a clean server process (or fresh interpreters)
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context(method)
+                )
+            pool = self._process_pool
+            
+            def parse(content: bytes) -> Dict:
+                return pool.submit(_parse_page_in_worker, content).result()
+            
+            def extract(url: str) -> Optional[Dict]:
+                return self._extract(url, parse)
+        
+        # Requests release the GIL while waiting on the network, so worker
+        # threads overlap the round-trips over the shared keep-alive session
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            results = executor.map(extract, urls)
+            return dict(zip(urls, results))
+
+
+# Parser used by _parse_page_in_worker, one per worker process
+_worker_parser: Optional[_PageParser] = None
+
+
+def _parse_page_in_worker(content: bytes) -> Dict:
+    """
+    Parse a page in a process pool worker
+    
+    Module level so it can be pickled; each worker builds its parser once.
+    
+    Args:
+        content: Raw HTML of the page
+        
+    Returns:
+        Dictionary of the extracted fields (without url and timestamp)
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = _PageParser()
+    return _worker_parser._parse_page(content)
\ No newline at end of file